@@ -0,0 +1,5 @@
+import sys
+
+from kalshi.cli import main
+
+sys.exit(main())
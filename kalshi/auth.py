@@ -1,11 +1,12 @@
 import datetime
 from requests.auth import AuthBase
-from cryptography.hazmat.primitives import serialization
-from cryptography.hazmat.backends import default_backend
 import base64
-from cryptography.hazmat.primitives import hashes
-from cryptography.hazmat.primitives.asymmetric import padding, rsa
-from cryptography.exceptions import InvalidSignature
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from cryptography.hazmat.primitives.asymmetric import rsa
+
+
 class KalshiAuth(AuthBase):
     """Attaches HTTP Pizza Authentication to the given Request object."""
     def __init__(self, key_id: str, key_file: str):
@@ -15,7 +16,12 @@ class KalshiAuth(AuthBase):
         self.private_key = self._load_private_key_from_file()
 
 
-    def _load_private_key_from_file(self) -> rsa.RSAPrivateKey:
+    def _load_private_key_from_file(self) -> 'rsa.RSAPrivateKey':
+        # cryptography is slow to import, only load it once a key is needed
+        from cryptography.hazmat.primitives import serialization
+        from cryptography.hazmat.backends import default_backend
+        from cryptography.hazmat.primitives.asymmetric import rsa
+
         with open(self.key_file, "rb") as key_file:
             private_key = serialization.load_pem_private_key(
                 key_file.read(),
@@ -29,6 +35,10 @@ class KalshiAuth(AuthBase):
         # Before signing, we need to hash our message.
         # The hash is what we actually sign.
         # Convert the text to bytes
+        from cryptography.hazmat.primitives import hashes
+        from cryptography.hazmat.primitives.asymmetric import padding
+        from cryptography.exceptions import InvalidSignature
+
         message = text.encode("utf-8")
         try:
             signature = self.private_key.sign(
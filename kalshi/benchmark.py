@@ -0,0 +1,128 @@
+import json
+import statistics
+import subprocess
+import sys
+from typing import NamedTuple, Optional
+
+# Dependencies that must only be imported by the commands that use them
+HEAVY_MODULES = (
+    'twilio',
+    'pydantic',
+    'cryptography',
+    'websocket',
+    'requests',
+    'dotenv',
+)
+
+# Module to import mapped to the dependencies importing it must not load.
+# The client needs requests and pydantic for every command, but cryptography,
+# websocket and twilio are only loaded once a key, stream or SMS is used.
+IMPORT_TARGETS = {
+    'kalshi.main': HEAVY_MODULES,
+    'kalshi.cli': HEAVY_MODULES,
+    'kalshi.client': ('cryptography', 'websocket', 'twilio'),
+    'kalshi.auth': ('cryptography', 'websocket', 'twilio'),
+    'kalshi.notification': ('twilio',),
+}
+
+_IMPORT_SCRIPT = '''
+import importlib, json, sys, time
+start = time.perf_counter()
+importlib.import_module({module!r})
+elapsed = time.perf_counter() - start
+forbidden = {forbidden!r}
+loaded = sorted(m for m in forbidden if m in sys.modules)
+print(json.dumps({{'seconds': elapsed, 'loaded': loaded}}))
+'''
+
+
+class ImportResult(NamedTuple):
+    module: str
+    median_ms: float
+    max_ms: float
+    loaded: list[str]
+    error: Optional[str] = None
+
+
+def measure_import(
+    module: str,
+    forbidden: tuple[str, ...] = HEAVY_MODULES,
+    runs: int = 5,
+) -> ImportResult:
+    """
+    Time importing a module in fresh interpreters.
+
+    Each run happens in its own process so nothing is cached in sys.modules.
+
+    Args:
+        module: Dotted module path to import
+        forbidden: Top level modules that importing it must not load
+        runs: Number of interpreters to spawn, at least 1
+
+    Returns:
+        ImportResult with the median and max import time and any forbidden
+        dependencies that were loaded as a side effect, or with error set to
+        the child's stderr if the module failed to import
+
+    Raises:
+        ValueError: If runs is less than 1
+    """
+    if runs < 1:
+        raise ValueError(f'runs must be at least 1, got {runs}')
+    script = _IMPORT_SCRIPT.format(module=module, forbidden=forbidden)
+    timings = []
+    loaded = set()
+    for _ in range(runs):
+        try:
+            proc = subprocess.run(
+                [sys.executable, '-c', script],
+                capture_output=True,
+                text=True,
+                check=True,
+            )
+        except subprocess.CalledProcessError as e:
+            return ImportResult(module, 0.0, 0.0, [], e.stderr.strip())
+        result = json.loads(proc.stdout.strip().splitlines()[-1])
+        timings.append(result['seconds'] * 1000)
+        loaded.update(result['loaded'])
+    return ImportResult(
+        module,
+        statistics.median(timings),
+        max(timings),
+        sorted(loaded),
+    )
+
+
+def check_imports(
+    budget_ms: Optional[float] = None,
+    runs: int = 5,
+    targets: dict[str, tuple[str, ...]] = IMPORT_TARGETS,
+) -> bool:
+    """
+    Benchmark import time of the entry points and report regressions.
+
+    A target regresses if it fails to import or drags in one of its forbidden
+    dependencies. Wall clock time depends on the machine, so going over
+    budget_ms is only reported and never fails the check.
+
+    Returns:
+        True if every target imports without loading forbidden modules
+    """
+    ok = True
+    for module, forbidden in targets.items():
+        result = measure_import(module, forbidden, runs)
+        if result.error:
+            print(f'{module}: FAIL import error\n{result.error}')
+            ok = False
+            continue
+        status = 'ok'
+        if result.loaded:
+            status = f'FAIL eagerly imports {", ".join(result.loaded)}'
+            ok = False
+        elif budget_ms is not None and result.median_ms > budget_ms:
+            status = f'slow, over advisory budget of {budget_ms:.1f}ms'
+        print(
+            f'{module}: median {result.median_ms:.1f}ms '
+            f'max {result.max_ms:.1f}ms ({runs} runs) {status}'
+        )
+    return ok
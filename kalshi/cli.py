@@ -0,0 +1,115 @@
+import argparse
+import datetime
+import logging
+import sys
+from typing import Optional
+
+# Keep this module cheap to import. Anything that pulls in requests, dotenv,
+# pydantic, cryptography, twilio or websocket is imported inside the command
+# using it, `kalshi profile` fails if that stops being true. See
+# kalshi.benchmark.IMPORT_TARGETS for what each module is allowed to load.
+
+
+def _setup():
+    from dotenv import load_dotenv
+
+    load_dotenv()
+    logging.basicConfig(level=logging.INFO)
+
+
+def backfill(args: argparse.Namespace) -> int:
+    from kalshi.client import KalshiHTTPClient
+    from kalshi.main import get_trades, read_markets
+
+    _setup()
+    client = KalshiHTTPClient()
+    get_trades(
+        client,
+        read_markets(),
+        start=args.start,
+        stop=args.stop,
+        start_date=args.since,
+    )
+    return 0
+
+
+def snapshot(args: argparse.Namespace) -> int:
+    from kalshi.client import KalshiHTTPClient
+    from kalshi.main import get_markets
+
+    _setup()
+    get_markets(KalshiHTTPClient())
+    return 0
+
+
+def watch(args: argparse.Namespace) -> int:
+    from kalshi.client import KalshiWebSocketClient
+
+    _setup()
+    KalshiWebSocketClient().connect()
+    return 0
+
+
+def profile(args: argparse.Namespace) -> int:
+    from kalshi.benchmark import check_imports
+
+    return 0 if check_imports(args.budget_ms, runs=args.runs) else 1
+
+
+def _positive_int(value: str) -> int:
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f'must be at least 1, got {number}')
+    return number
+
+
+def _date(value: str) -> datetime.datetime:
+    return datetime.datetime.strptime(value, '%Y-%m-%d')
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog='kalshi')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    p = commands.add_parser(
+        'backfill', help='Download trades for markets in markets.jsonl'
+    )
+    p.add_argument('--start', type=int, default=780, help='First market index')
+    p.add_argument('--stop', type=int, default=1000, help='Index to stop before')
+    p.add_argument(
+        '--since',
+        type=_date,
+        default=datetime.datetime(2024, 1, 1),
+        help='Only fetch trades after this date (YYYY-MM-DD)',
+    )
+    p.set_defaults(func=backfill)
+
+    p = commands.add_parser(
+        'snapshot', help='Write all open markets to markets.jsonl'
+    )
+    p.set_defaults(func=snapshot)
+
+    p = commands.add_parser('watch', help='Stream ticker updates')
+    p.set_defaults(func=watch)
+
+    p = commands.add_parser(
+        'profile', help='Benchmark import time of the CLI entry points'
+    )
+    p.add_argument('--runs', type=_positive_int, default=5)
+    p.add_argument(
+        '--budget-ms',
+        type=float,
+        default=None,
+        help='Flag modules whose median import time exceeds this, advisory only',
+    )
+    p.set_defaults(func=profile)
+    return parser
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -9,7 +9,6 @@ import requests
 
 from kalshi.auth import KalshiAuth
 from kalshi.constants import READ_LIMIT, WEBSOCKET_URL, WRITE_LIMIT, Endpoints
-from websocket import WebSocketApp
 import logging
 
 from kalshi.types import GetEventsParams, GetMarketsParams, GetTradesParams, Market, Params, Response, Trade
@@ -161,6 +160,9 @@ class KalshiWebSocketClient(KalshiBaseClient):
 
     def connect(self):
         """Establishes a WebSocket connection using authentication."""
+        # Only the watch command streams, so don't pay for websocket at import
+        from websocket import WebSocketApp
+
         host = self.ws_base_url + self.url_suffix
         auth_headers = self.auth.get_headers('GET', self.url_suffix)
         header_list = [f'{k}: {v}' for k, v in auth_headers.items()]
@@ -1,33 +1,49 @@
 import datetime
 import json
 import os
-import time
-from dotenv import load_dotenv
 import shlex
 import logging
-from twilio.rest import Client
-from twilio.base.exceptions import TwilioRestException
-
-from kalshi.client import KalshiHTTPClient, KalshiWebSocketClient
-from kalshi.notification import TwilioClient
-from kalshi.types import GetMarketsParams, GetTradesParams, Market, MarketStatus, Trade, GetEventsParams
-from kalshi.utils import analyze_json_type
+from typing import TYPE_CHECKING
 from dataclasses import asdict
 
+# kalshi.client pulls in requests, pydantic and cryptography, keep it out of
+# module scope so short lived workers only pay for what they use
+if TYPE_CHECKING:
+    from kalshi.client import KalshiHTTPClient
+
 _logger = logging.getLogger(__name__)
 
 
-def get_markets(client: KalshiHTTPClient):
+def _json_default(value):
+    # Match the API's ISO 8601 timestamps, e.g. 2024-01-01T00:00:00+00:00
+    if isinstance(value, (datetime.datetime, datetime.date)):
+        return value.isoformat()
+    raise TypeError(f'Object of type {type(value).__name__} is not JSON serializable')
+
+def get_markets(client: 'KalshiHTTPClient'):
+    from kalshi.types import GetMarketsParams, MarketStatus
+
     params = GetMarketsParams(status=MarketStatus.OPEN)
     markets = list(client.get_markets(params))
     _logger.info(f'Got {len(markets)} markets')
-    markets.sort(key=lambda x: x['volume_24h'], reverse=True)
+    markets.sort(key=lambda x: x.volume_24h, reverse=True)
     with open('./kalshi/data/markets.jsonl', 'w', encoding='utf-8') as f:
-        f.writelines([json.dumps(market, ensure_ascii=False) + '\n' for market in markets])
+        f.writelines([json.dumps(asdict(market), ensure_ascii=False, default=_json_default) + '\n' for market in markets])
 
-def get_trades(client: KalshiHTTPClient, markets):
-    start_date = datetime.datetime(2024,1,1)
-    for market in markets[780:1000]:
+def read_markets():
+    with open('./kalshi/data/markets.jsonl', 'r', encoding='utf-8') as f:
+        return [json.loads(line) for line in f]
+
+def get_trades(
+    client: 'KalshiHTTPClient',
+    markets,
+    start: int = 780,
+    stop: int = 1000,
+    start_date: datetime.datetime = datetime.datetime(2024, 1, 1),
+):
+    from kalshi.types import GetTradesParams
+
+    for market in markets[start:stop]:
         if '/' in market['ticker']:
             continue
         _logger.info(f'Getting trades for {market["ticker"]}')
@@ -47,11 +63,11 @@ def get_trades(client: KalshiHTTPClient, markets):
             if len(batch) == 1000:
                 with open(filename, 'a', encoding='utf-8') as f:
                     _logger.info(f'Writing Batch')
-                    f.writelines([json.dumps(trade, ensure_ascii=False) + '\n' for trade in batch])
+                    f.writelines([json.dumps(asdict(trade), ensure_ascii=False, default=_json_default) + '\n' for trade in batch])
                     batch = []
         if batch:
             with open(filename, 'a', encoding='utf-8') as f:
-                f.writelines([json.dumps(trade, ensure_ascii=False) + '\n' for trade in batch])
+                f.writelines([json.dumps(asdict(trade), ensure_ascii=False, default=_json_default) + '\n' for trade in batch])
         _logger.info(f'Got {nt} trades for {market["ticker"]}')
 
 def read_trades():
@@ -61,6 +77,10 @@ def read_trades():
                 yield json.loads(line)
 
 def main():
+    from dotenv import load_dotenv
+    from kalshi.client import KalshiHTTPClient
+    from kalshi.types import GetMarketsParams, MarketStatus
+
     load_dotenv() 
     logging.basicConfig(level=logging.INFO)
     client = KalshiHTTPClient()
@@ -2,8 +2,6 @@ import os
 import logging
 from typing import Optional, List, Dict, Any, Union
 from dotenv import load_dotenv
-from twilio.rest import Client
-from twilio.base.exceptions import TwilioRestException
 
 _logger = logging.getLogger(__name__)
 
@@ -27,7 +25,10 @@ class TwilioClient:
                 'TWILIO_AUTH_TOKEN, and TWILIO_PHONE_NUMBER in .env file'
             )
         
-        # Initialize the Twilio client
+        # Initialize the Twilio client, twilio is imported here rather than at
+        # module level since it is slow to load and most commands never use it
+        from twilio.rest import Client
+
         self.client = Client(self.account_sid, self.auth_token)
     
     def send_message(
@@ -50,6 +51,8 @@ class TwilioClient:
         Raises:
             TwilioRestException: If the API request fails
         """
+        from twilio.base.exceptions import TwilioRestException
+
         _logger.info(f'Sending message to {to_phone}')
         
         try: